@@ -1,3 +1,7 @@
+from collections import deque
+from heapq import heappush, heappop
+
+
 class Container:
     """A container that holds objects.
 
@@ -30,6 +34,68 @@ class Container:
         raise NotImplementedError("Implemented in a subclass")
 
 
+class Queue(Container):
+    """A queue of items that operates in first in, first out order.
+
+    Items are removed from the queue in the order in which they were added.
+    """
+
+    # === Private Attributes ===
+    # @type _items: deque
+    #     The items stored in the queue. The front of the queue is at the
+    #     left end.
+
+    def __init__(self):
+        """Initialize an empty Queue.
+
+        @type self: Queue
+        @rtype: None
+        """
+        self._items = deque()
+
+    def add(self, item):
+        """Add <item> to the back of this Queue.
+
+        @type self: Queue
+        @type item: object
+        @rtype: None
+        """
+        self._items.append(item)
+
+    def remove(self):
+        """Remove and return the item at the front of this Queue.
+
+        Precondition: <self> should not be empty.
+
+        @type self: Queue
+        @rtype: object
+
+        >>> q = Queue()
+        >>> q.add("red")
+        >>> q.add("blue")
+        >>> q.remove()
+        'red'
+        >>> q.remove()
+        'blue'
+        """
+        return self._items.popleft()
+
+    def is_empty(self):
+        """Return True iff this Queue is empty.
+
+        @type self: Queue
+        @rtype: bool
+
+        >>> q = Queue()
+        >>> q.is_empty()
+        True
+        >>> q.add("thing")
+        >>> q.is_empty()
+        False
+        """
+        return not self._items
+
+
 class PriorityQueue(Container):
     """A queue of items that operates in priority order.
 
@@ -39,28 +105,61 @@ class PriorityQueue(Container):
     removed.
 
     Priority is defined by the rich comparison methods for the objects in the
-    container (__lt__, __le__, __gt__, __ge__).
+    container (__lt__, __le__, __gt__, __ge__), or, if the queue was created
+    with a key function, by comparing key(x) and key(y) instead.
 
     If x < y, then x has a *HIGHER* priority than y.
 
     All objects in the container must be of the same type.
+
+    Membership tests and delete() find items by equality (==), and take
+    time proportional to the size of the queue. add() and remove() do not
+    pay for them.
     """
 
     # === Private Attributes ===
-    # @type _items: list
-    #     The items stored in the priority queue.
+    # @type _items: list[tuple]
+    #     A heap of (priority, order, item) entries. <priority> is key(item),
+    #     or the item itself if there is no key. <order> is the number of
+    #     items added before this one, so entries with equal priorities are
+    #     ordered first in, first out, and items are never compared with
+    #     each other.
+    # @type _key: callable | None
+    #     The function that gives the priority of an item, or None.
+    # @type _deleted: set[int]
+    #     The orders of the entries in _items that have been deleted. Such
+    #     entries are discarded when they reach the top of the heap.
+    # @type _order: int
+    #     The number of items that have ever been added.
     #
     # === Representation Invariants ===
-    # _items is a sorted list, where the first item in the queue is the
-    # item with the highest priority.
+    # _items satisfies the heap invariant, so the first entry in _items is
+    # the highest priority entry.
+    # Every order in _deleted is the order of an entry in _items.
 
-    def __init__(self):
+    def __init__(self, key=None):
         """Initialize an empty PriorityQueue.
 
+        Giving a <key> that returns a plain value, such as an int, lets the
+        queue compare priorities without calling the items' comparison
+        methods.
+
         @type self: PriorityQueue
+        @type key: callable | None
+            A function of one item that returns its priority.
         @rtype: None
+
+        >>> pq = PriorityQueue(key=len)
+        >>> pq.add("yellow")
+        >>> pq.add("red")
+        >>> pq.add("blue")
+        >>> pq.remove()
+        'red'
         """
         self._items = []
+        self._key = key
+        self._deleted = set()
+        self._order = 0
 
     def remove(self):
         """Remove and return the next item from this PriorityQueue.
@@ -84,7 +183,13 @@ class PriorityQueue(Container):
         >>> pq.remove()
         'yellow'
         """
-        return self._items.pop(0)
+        entry = heappop(self._items)
+        deleted = self._deleted
+        if deleted:
+            while entry[1] in deleted:
+                deleted.remove(entry[1])
+                entry = heappop(self._items)
+        return entry[2]
 
     def is_empty(self):
         """
@@ -100,7 +205,7 @@ class PriorityQueue(Container):
         >>> pq.is_empty()
         False
         """
-        return len(self._items) == 0
+        return len(self._items) == len(self._deleted)
 
     def add(self, item):
         """Add <item> to this PriorityQueue.
@@ -114,44 +219,70 @@ class PriorityQueue(Container):
         >>> pq.add("blue")
         >>> pq.add("red")
         >>> pq.add("green")
-        >>> pq._items
-        ['blue', 'green', 'red', 'yellow']
+        >>> pq._items[0][2]
+        'blue'
         """
-        #TODO
-        appended = False
-        x = 0
-        while x < (len(self._items)) and not appended:
-            if item.__le__(self._items[x]):
-                self._items.insert(x,item)
-                appended = True
-            elif item.__eq__(self._items[x]):
-                if x != len(self._items) - 1:
-                    self._items.insert(x+1,item)
-                    appended = True
-                else:
-                    self._items.append(item)
-                    appended = True
-            x += 1
-        if not appended:
-            self._items.append(item)
+        key = self._key
+        heappush(self._items,
+                 (item if key is None else key(item), self._order, item))
+        self._order += 1
 
-    def __contains__(self, item):
-        """
+    def _find(self, item):
+        """Return the highest priority entry whose item equals <item> and
+        has not been deleted, or None if there is no such entry.
 
-        @type
-        @type item:
-        @return:
+        @type self: PriorityQueue
+        @type item: object
+        @rtype: tuple | None
         """
-        #TODO
+        deleted = self._deleted
+        found = None
+        for entry in self._items:
+            if (entry[2] == item and entry[1] not in deleted and
+                    (found is None or entry[:2] < found[:2])):
+                found = entry
+        return found
 
-        return item in self._items
+    def __contains__(self, item):
+        """Return True iff an item equal to <item> is in this PriorityQueue.
+
+        @type self: PriorityQueue
+        @type item: object
+        @rtype: bool
 
-    def delete(self,item):
+        >>> pq = PriorityQueue()
+        >>> pq.add("red")
+        >>> "red" in pq
+        True
+        >>> pq.delete("red")
+        >>> "red" in pq
+        False
         """
+        return self._find(item) is not None
+
+    def delete(self, item):
+        """Delete the highest priority item equal to <item> from this
+        PriorityQueue, if there is one.
+
+        The item is only marked as deleted; it is discarded once it reaches
+        the front of the queue.
+
+        @type self: PriorityQueue
+        @type item: object
+        @rtype: None
 
-        @param item:
-        @return:
+        >>> pq = PriorityQueue()
+        >>> pq.add("red")
+        >>> pq.add("blue")
+        >>> pq.delete("blue")
+        >>> pq.remove()
+        'red'
+        >>> pq.is_empty()
+        True
         """
-        #TODO
-        if item in self._items:
-            self._items.remove(item)
\ No newline at end of file
+        entry = self._find(item)
+        if entry is not None:
+            self._deleted.add(entry[1])
+            if len(self._deleted) == len(self._items):
+                self._items = []
+                self._deleted = set()
@@ -1,10 +1,8 @@
+from bisect import bisect_left, insort
 from driver import Driver
-from rider import Rider
-from container import PriorityQueue
-
-WAITING = "waiting"
-CANCELLED = "cancelled"
-SATISFIED = "satisfied"
+from rider import Rider, WAITING, AFTER_CANCEL
+from container import Queue
+from location import travel_time
 
 
 class Dispatcher:
@@ -23,6 +21,22 @@ class Dispatcher:
     rider requests.
     """
 
+    # === Private Attributes ===
+    # @type _driver_ids: set[str]
+    #     The identifiers of every driver registered in driver_list.
+    # @type _bands: dict[int, list[list]]
+    #     The drivers waiting to be assigned a rider, grouped by the row they
+    #     are in. Each band is four parallel lists: the drivers, their
+    #     columns, their speeds, and the order in which they became
+    #     available. An available driver is idle, so it does not move until
+    #     it is handed out by request_driver.
+    # @type _band_rows: list[int]
+    #     The keys of _bands, in increasing order.
+    # @type _max_speed: int
+    #     The highest speed of any driver that has been available.
+    # @type _order: int
+    #     The number of times a driver has become available.
+
     def __init__(self):
         """Initialize a Dispatcher.
 
@@ -30,7 +44,15 @@ class Dispatcher:
         @rtype: None
         """
         self.driver_list = []
-        self.rider_queue = PriorityQueue()
+        # Riders only join the waiting list from their own RiderRequest,
+        # and events are done in timestamp order, so a first in, first out
+        # queue already holds the waiting riders in timestamp order.
+        self.rider_queue = Queue()
+        self._driver_ids = set()
+        self._bands = {}
+        self._band_rows = []
+        self._max_speed = 0
+        self._order = 0
 
     def __str__(self):
         """Return a string representation.
@@ -46,20 +68,107 @@ class Dispatcher:
 
         Add the rider to the waiting list if there is no available driver.
 
+        The driver that can reach the rider soonest is chosen. Ties go to the
+        driver that became available first.
+
         @type self: Dispatcher
         @type rider: Rider
         @rtype: Driver | None
+
+        >>> from location import Location
+        >>> dispatcher = Dispatcher()
+        >>> near = Driver(0, 'Near', Location(1, 3), 1)
+        >>> fast = Driver(0, 'Fast', Location(4, 5), 7)
+        >>> dispatcher.request_rider(near)
+        >>> dispatcher.request_rider(fast)
+        >>> rider = Rider(0, 'Ann', 10, Location(1, 1), Location(5, 5))
+        >>> dispatcher.request_driver(rider).id
+        'Fast'
+
+        Fast is 7 blocks away and Near only 2, but Fast arrives in 1 minute
+        and Near in 2. Fast was alone in row 4, so that row is dropped.
+
+        >>> dispatcher._band_rows
+        [1]
+        >>> first = Driver(0, 'First', Location(3, 1), 1)
+        >>> dispatcher.request_rider(first)
+        >>> dispatcher.request_driver(rider).id
+        'Near'
+        >>> dispatcher.request_rider(near)
+        >>> dispatcher.request_driver(rider).id
+        'First'
+
+        Near and First both arrive in 2 minutes. Near wins while it became
+        available first, and loses once it becomes available again.
+
+        >>> dispatcher.request_driver(rider).id
+        'Near'
+        >>> dispatcher._band_rows
+        []
+        >>> dispatcher.request_driver(rider) is None
+        True
         """
-        if len(self.driver_list) == 0:
+        origin = rider.origin
+        origin_row = origin.row
+        origin_col = origin.col
+        bands = self._bands
+        band_rows = self._band_rows
+        max_speed = self._max_speed
+        fastest_band = None
+        fastest_index = -1
+        fastest_time = None
+        fastest_order = None
+        # Visit the rows that have available drivers from the nearest to
+        # the farthest, using one index below and one above the origin row.
+        above = bisect_left(band_rows, origin_row)
+        below = above - 1
+        while below >= 0 or above < len(band_rows):
+            if below < 0 or (above < len(band_rows) and
+                             band_rows[above] - origin_row <=
+                             origin_row - band_rows[below]):
+                row = band_rows[above]
+                above += 1
+            else:
+                row = band_rows[below]
+                below -= 1
+            # No driver in this row, or any farther one, can arrive sooner
+            # than the fastest driver could cover the rows alone.
+            if fastest_time is not None and travel_time(
+                    row, origin_col, origin_row, origin_col,
+                    max_speed) > fastest_time:
+                break
+            band = bands[row]
+            drivers, cols, speeds, orders = band
+            row_distance = abs(row - origin_row)
+            for i in range(len(drivers)):
+                # The body of location.travel_time, inlined: this loop runs
+                # for every nearby driver on every rider request.
+                speed = speeds[i]
+                distance = row_distance + abs(cols[i] - origin_col)
+                time = distance // speed
+                twice_remainder = 2 * (distance - time * speed)
+                if twice_remainder > speed or (twice_remainder == speed and
+                                               time & 1):
+                    time += 1
+                if (fastest_time is None or time < fastest_time or
+                        (time == fastest_time and orders[i] < fastest_order)):
+                    fastest_band = band
+                    fastest_index = i
+                    fastest_time = time
+                    fastest_order = orders[i]
+        if fastest_band is None:
             self.rider_queue.add(rider)
             return None
-        else:
-            shortest_time = self.driver_list[0]
-            for name in self.driver_list:
-                if name.get_travel_time(rider.destination) < shortest_time.get_travel_time(rider.destination):
-                    if name.is_idle:
-                        shortest_time = name
-        return shortest_time
+        drivers, cols, speeds, orders = fastest_band
+        driver = drivers.pop(fastest_index)
+        del cols[fastest_index]
+        del speeds[fastest_index]
+        del orders[fastest_index]
+        if not drivers:
+            row = driver.location.row
+            del bands[row]
+            del band_rows[bisect_left(band_rows, row)]
+        return driver
 
     def request_rider(self, driver):
         """Return a rider for the driver, or None if no rider is available.
@@ -70,19 +179,38 @@ class Dispatcher:
         @type driver: Driver
         @rtype: Rider | None
         """
-        if not self.rider_queue.is_empty():
-            return self.rider_queue.remove()
-        else:
+        if driver.id not in self._driver_ids:
+            self._driver_ids.add(driver.id)
             self.driver_list.append(driver)
-            return None
+        while not self.rider_queue.is_empty():
+            rider = self.rider_queue.remove()
+            # Cancelled riders are left in the queue by cancel_ride and
+            # discarded here, when they reach the front.
+            if rider.status is WAITING:
+                return rider
+        row = driver.location.row
+        band = self._bands.get(row)
+        if band is None:
+            band = [[], [], [], []]
+            self._bands[row] = band
+            insort(self._band_rows, row)
+        drivers, cols, speeds, orders = band
+        drivers.append(driver)
+        cols.append(driver.location.col)
+        speeds.append(driver.speed)
+        orders.append(self._order)
+        self._order += 1
+        self._max_speed = max(self._max_speed, driver.speed)
+        return None
 
     def cancel_ride(self, rider):
         """Cancel the ride for rider.
 
+        A waiting rider is marked as cancelled but not searched for in the
+        waiting list; request_rider skips it once it reaches the front.
+
         @type self: Dispatcher
         @type rider: Rider
         @rtype: None
         """
-        if self.rider_queue.__contains__(rider):
-            self.rider_queue.delete(rider)
-            rider.status = CANCELLED
+        rider.status = AFTER_CANCEL[rider.status]
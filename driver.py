@@ -1,9 +1,5 @@
-from location import Location, manhattan_distance
-from rider import Rider
-
-WAITING = "waiting"
-CANCELLED = "cancelled"
-SATISFIED = "satisfied"
+from location import Location, travel_time
+from rider import Rider, SATISFIED
 
 class Driver:
     """A driver for a ride-sharing service.
@@ -17,6 +13,9 @@ class Driver:
         A property that is True if the driver is idle and False otherwise.
     """
 
+    __slots__ = ('id', 'location', 'speed', 'destination', 'rider', 'is_idle',
+                 'timestamp')
+
     def __init__(self, timestamp, identifier, location, speed):
         """Initialize a Driver.
 
@@ -45,10 +44,21 @@ class Driver:
     def __eq__(self, other):
         """Return True if self equals other, and false otherwise.
 
+        Drivers are equal iff they have the same identifier.
+
         @type self: Driver
+        @type other: Driver
         @rtype: bool
         """
-        return self.timestamp == other.timestamp
+        return isinstance(other, Driver) and self.id == other.id
+
+    def __hash__(self):
+        """Return a hash consistent with __eq__.
+
+        @type self: Driver
+        @rtype: int
+        """
+        return hash(self.id)
 
     def get_travel_time(self, destination):
         """Return the time it will take to arrive at the destination,
@@ -58,7 +68,8 @@ class Driver:
         @type destination: Location
         @rtype: int
         """
-        return round(manhattan_distance(self.location,destination)/self.speed)
+        return travel_time(self.location.row, self.location.col,
+                           destination.row, destination.col, self.speed)
 
     def start_drive(self, location):
         """Start driving to the location and return the time the drive will take.
@@ -81,6 +92,7 @@ class Driver:
         @rtype: None
         """
         self.location = self.destination
+        self.destination = None
         self.is_idle = True
 
     def start_ride(self, rider):
@@ -90,11 +102,15 @@ class Driver:
         @type rider: Rider
         @rtype: int
         """
+        origin = rider.origin
+        destination = rider.destination
         self.rider = rider
-        self.location = rider.origin
+        self.location = origin
+        self.destination = destination
+        self.is_idle = False
         rider.status = SATISFIED
-        time = self.start_drive(rider.destination)
-        return time
+        return travel_time(origin.row, origin.col,
+                           destination.row, destination.col, self.speed)
 
     def end_ride(self):
         """End the current ride, and arrive at the rider's destination.
@@ -105,7 +121,5 @@ class Driver:
         @type self: Driver
         @rtype: None
         """
-        self.rider.status = SATISFIED
         self.rider = None
         self.end_drive()
-        self.destination = None
@@ -9,9 +9,6 @@ from driver import Driver
 from location import deserialize_location
 from monitor import Monitor, RIDER, DRIVER, REQUEST, CANCEL, PICKUP, DROPOFF
 
-WAITING = "waiting"
-CANCELLED = "cancelled"
-SATISFIED = "satisfied"
 
 class Event:
     """An event.
@@ -33,6 +30,8 @@ class Event:
         A timestamp for this event.
     """
 
+    __slots__ = ('timestamp',)
+
     def __init__(self, timestamp):
         """Initialize an Event with a given timestamp.
 
@@ -171,7 +170,7 @@ class Event:
         Notify the monitor of any activities that have occurred during the
         event.
 
-        Return a list of new events spawned by this event (making sure the
+        Return a tuple of new events spawned by this event (making sure the
         timestamps are correct).
 
         Note: the "business logic" of what actually happens should not be
@@ -180,7 +179,7 @@ class Event:
         @type self: Event
         @type dispatcher: Dispatcher
         @type monitor: Monitor
-        @rtype: list[Event]
+        @rtype: tuple[Event]
         """
         raise NotImplementedError("Implemented in a subclass")
 
@@ -193,6 +192,8 @@ class RiderRequest(Event):
         The rider.
     """
 
+    __slots__ = ('rider',)
+
     def __init__(self, timestamp, rider):
         """Initialize a RiderRequest event.
 
@@ -208,24 +209,28 @@ class RiderRequest(Event):
         If the rider is assigned to a driver, the driver starts driving to
         the rider.
 
-        Return a Cancellation event. If the rider is assigned to a driver,
-        also return a Pickup event.
+        If the rider is assigned to a driver, return a Pickup event. Also
+        return a Cancellation event, unless the driver will pick the rider
+        up before the rider runs out of patience.
 
         @type self: RiderRequest
         @type dispatcher: Dispatcher
         @type monitor: Monitor
-        @rtype: list[Event]
+        @rtype: tuple[Event]
         """
         monitor.notify(self.timestamp, RIDER, REQUEST,
                        self.rider.id, self.rider.origin)
 
-        events = []
         driver = dispatcher.request_driver(self.rider)
-        if driver is not None:
-            travel_time = driver.start_drive(self.rider.origin)
-            events.append(Pickup(self.timestamp + travel_time, self.rider, driver))
-        events.append(Cancellation(self.timestamp + self.rider.patience, self.rider, driver))
-        return events
+        expires_at = self.rider.expires_at
+        if driver is None:
+            return (Cancellation(expires_at, self.rider, driver),)
+        pickup_time = self.timestamp + driver.start_drive(self.rider.origin)
+        pickup = Pickup(pickup_time, self.rider, driver)
+        if pickup_time < expires_at:
+            # The rider is satisfied before the Cancellation would run.
+            return (pickup,)
+        return (pickup, Cancellation(expires_at, self.rider, driver))
 
     def __str__(self):
         """Return a string representation of this event.
@@ -244,6 +249,8 @@ class DriverRequest(Event):
         The driver.
     """
 
+    __slots__ = ('driver',)
+
     def __init__(self, timestamp, driver):
         """Initialize a DriverRequest event.
 
@@ -263,7 +270,7 @@ class DriverRequest(Event):
         @type self: DriverRequest
         @type dispatcher: Dispatcher
         @type monitor: Monitor
-        @rtype: list[Event]
+        @rtype: tuple[Event]
         """
         # Notify the monitor about the request.
 
@@ -271,17 +278,15 @@ class DriverRequest(Event):
         # If there is one available, the driver starts driving towards the
         # rider, and the method returns a Pickup event for when the driver
         # arrives at the riders location.
-        monitor.notify(self, DRIVER, REQUEST, self.driver.id, self.driver.location)
+        monitor.notify(self.timestamp, DRIVER, REQUEST, self.driver.id, self.driver.location)
 
         rider = dispatcher.request_rider(self.driver)
-        events = []
-        if rider is not None:
-            travel_time = self.driver.start_drive(rider.origin)  # changed destination to origin
-            events.append(Pickup(self.timestamp + travel_time, rider, self.driver))  # rider.patience replaced
-            # with travel time
-            # events.append(Cancellation(self.timestamp + rider.patience, rider, self.driver))  # tab added here,
-            # changed starter code
-        return events
+        if rider is None:
+            return ()
+        travel_time = self.driver.start_drive(rider.origin)
+        # The rider scheduled their own Cancellation when they requested a
+        # driver, so only the Pickup is returned here.
+        return (Pickup(self.timestamp + travel_time, rider, self.driver),)
 
     def __str__(self):
         """Return a string representation of this event.
@@ -302,6 +307,8 @@ class Cancellation(Event):
     @type timestamp: int
         The timestamp.
     """
+    __slots__ = ('rider', 'driver')
+
     def __init__(self, timestamp, rider, driver):
         """
 
@@ -326,13 +333,14 @@ class Cancellation(Event):
 
         @param dispatcher: Dispatcher
         @param monitor: Monitor
-        @return: None
+        @return: tuple[Event]
         """
-        if self.rider.status == WAITING:
+        if self.rider.status is WAITING:
             monitor.notify(self.timestamp, RIDER, CANCEL, self.rider.id, self.rider.origin)
 
             dispatcher.cancel_ride(self.rider)
             # Cancel the ride, if the rider is waiting.
+        return ()
 
 class Pickup(Event):
     """A driver picks up a passenger
@@ -345,6 +353,8 @@ class Pickup(Event):
     @type timestamp: int
         The timestamp
     """
+    __slots__ = ('rider', 'driver')
+
     def __init__(self, timestamp, rider, driver):
         """
 
@@ -368,23 +378,22 @@ class Pickup(Event):
     def do(self, dispatcher, monitor):
         """Set the drivers passenger as the rider.
 
+        If the rider has cancelled, the driver stops at the rider's location
+        and immediately requests a new rider.
+
         @param dispatcher:
         @param monitor:
-        @return: list[Event]
+        @return: tuple[Event]
         """
-        if self.rider.status == WAITING:
+        if self.rider.status is WAITING:
             time = self.driver.start_ride(self.rider)
-            monitor.notify(self.timestamp, DRIVER, PICKUP, self.driver.id, self.rider.origin)
-            monitor.notify(self.timestamp, RIDER, PICKUP, self.rider.id, self.rider.origin)
-            # Notify the monitor
-            events = []
-            events.append(Dropoff(self.timestamp + time, self.rider, self.driver))
-            # Add a Dropoff event
-            dispatcher.cancel_ride(self.rider)
-            # Remove the rider from the queue
-        else:
-            self.driver.rider = None
-        return events
+            notify = monitor.notify
+            notify(self.timestamp, DRIVER, PICKUP, self.driver.id, self.rider.origin)
+            notify(self.timestamp, RIDER, PICKUP, self.rider.id, self.rider.origin)
+            # Notify the monitor, then add a Dropoff event
+            return (Dropoff(self.timestamp + time, self.rider, self.driver),)
+        self.driver.end_drive()
+        return (DriverRequest(self.timestamp, self.driver),)
 
 
 class Dropoff(Event):
@@ -399,6 +408,8 @@ class Dropoff(Event):
         The timestamp
     """
 
+    __slots__ = ('rider', 'driver')
+
     def __init__(self, timestamp, rider, driver):
         """Initialize a Dropoff event.
 
@@ -411,7 +422,6 @@ class Dropoff(Event):
         self.rider = rider
         self.timestamp = timestamp
         self.driver = driver
-        self.driver.end_ride()
 
     def __str__(self):
         """Return a string representation of the event.
@@ -424,13 +434,47 @@ class Dropoff(Event):
         """Set the drivers passenger to None, finish the ride.
         @param dispatcher: Dispatcher
         @param monitor: Monitor
-        @return: list[Event]
+        @return: tuple[Event]
         """
-        monitor.notify(self.timestamp, DRIVER, DROPOFF, self.driver.id, self.rider.destination)
-        monitor.notify(self.timestamp, RIDER, DROPOFF, self.rider.id, self.rider.destination)
-        events = []
-        events.append(DriverRequest(self.timestamp, self.driver))
-        return events
+        self.driver.end_ride()
+        notify = monitor.notify
+        notify(self.timestamp, DRIVER, DROPOFF, self.driver.id, self.rider.destination)
+        notify(self.timestamp, RIDER, DROPOFF, self.rider.id, self.rider.destination)
+        return (DriverRequest(self.timestamp, self.driver),)
+
+
+def _make_driver_request(timestamp, tokens):
+    """Return the DriverRequest described by the words <tokens> of a line.
+
+    @type timestamp: int
+    @type tokens: list[str]
+        e.g. ['0', 'DriverRequest', 'Amaranth', '1,1', '1']
+    @rtype: DriverRequest
+    """
+    driver = Driver(timestamp, tokens[2], deserialize_location(tokens[3]),
+                    int(tokens[4]))
+    return DriverRequest(timestamp, driver)
+
+
+def _make_rider_request(timestamp, tokens):
+    """Return the RiderRequest described by the words <tokens> of a line.
+
+    @type timestamp: int
+    @type tokens: list[str]
+        e.g. ['10', 'RiderRequest', 'Cerise', '4,2', '1,5', '15']
+    @rtype: RiderRequest
+    """
+    rider = Rider(timestamp, tokens[2], int(tokens[5]),
+                  deserialize_location(tokens[3]),
+                  deserialize_location(tokens[4]))
+    return RiderRequest(timestamp, rider)
+
+
+# The function that builds each type of event in an event list file.
+_EVENT_FACTORIES = {
+    "DriverRequest": _make_driver_request,
+    "RiderRequest": _make_rider_request
+}
 
 
 def create_event_list(filename):
@@ -446,33 +490,18 @@ def create_event_list(filename):
     events = []
     with open(filename, "r") as file:
         for line in file:
-            line = line.strip()
+            # Create a list of words in the line, e.g.
+            # ['10', 'RiderRequest', 'Cerise', '4,2', '1,5', '15'].
+            # split() already discards surrounding whitespace.
+            tokens = line.split()
 
-            if not line or line.startswith("#"):
+            if not tokens or tokens[0].startswith("#"):
                 # Skip lines that are blank or start with #.
                 continue
 
-            # Create a list of words in the line, e.g.
-            # ['10', 'RiderRequest', 'Cerise', '4,2', '1,5', '15'].
-            # Note that these are strings, and you'll need to convert some
-            # of them to a different type.
-            tokens = line.split()
-            timestamp = int(tokens[0])
             event_type = tokens[1]
-
-            # HINT: Use Location.deserialize to convert the location string to
-            # a location.
-
-            if event_type == "DriverRequest":
-                temp_Driver = Driver(timestamp, tokens[2],deserialize_location(tokens[3]),int(tokens[4]))
-                Event = DriverRequest(timestamp,temp_Driver)
-                # Create a DriverRequest event.
-                pass
-            elif event_type == "RiderRequest":
-                temp_Rider = Rider(timestamp, tokens[2],int(tokens[5]), deserialize_location(tokens[3]),
-                                   deserialize_location(tokens[4]))
-                Event = RiderRequest(timestamp,temp_Rider)
-                # Create a RiderRequest event.
-                pass
-            events.append(Event)
+            factory = _EVENT_FACTORIES.get(event_type)
+            if factory is None:
+                raise ValueError("Unknown event type: " + event_type)
+            events.append(factory(int(tokens[0]), tokens))
     return events
@@ -1,15 +1,89 @@
 class Location:
-    def __init__(self, row, column):
-        """Initialize a location.
+    """A location on the city grid.
 
-        @type self: Location
+    Locations are interned: constructing a Location with the same row and
+    column twice returns the same object. A Location must therefore never
+    be modified after it is created.
+
+    === Attributes ===
+    @type row: int
+        The row of the location.
+    @type col: int
+        The column of the location.
+    """
+
+    __slots__ = ('row', 'col')
+
+    # === Private Attributes ===
+    # @type _interned: dict[tuple[int, int], Location]
+    #     The one Location created for each (row, column) pair. It is shared
+    #     by every Simulation in the process and never cleared, so it holds
+    #     one Location for each distinct point seen since the module was
+    #     imported.
+    _interned = {}
+
+    def __new__(cls, row, column):
+        """Return the location at <row>, <column>, creating it only if it
+        has not been created before.
+
+        @type cls: type
         @type row: int
         @type column: int
+        @rtype: Location
+
+        >>> Location(1, 2) is Location(1, 2)
+        True
+        """
+        key = (row, column)
+        location = cls._interned.get(key)
+        if location is None:
+            location = super().__new__(cls)
+            object.__setattr__(location, 'row', row)
+            object.__setattr__(location, 'col', column)
+            cls._interned[key] = location
+        return location
+
+    def __reduce__(self):
+        """Return how to recreate this location: by calling Location with its
+        row and column, so that copied and unpickled locations are looked up
+        among the interned ones.
+
+        @type self: Location
+        @rtype: tuple[type, tuple[int, int]]
+
+        >>> from copy import deepcopy
+        >>> deepcopy(Location(1, 2)) is Location(1, 2)
+        True
+        """
+        return Location, (self.row, self.col)
+
+    def __setattr__(self, name, value):
+        """Raise an AttributeError: a location is shared by everything at
+        that point of the grid, so it must never be modified.
+
+        @type self: Location
+        @type name: str
+        @type value: object
+        @rtype: None
+
+        >>> Location(1, 2).row = 5
+        Traceback (most recent call last):
+        AttributeError: Location is immutable
+        """
+        raise AttributeError("Location is immutable")
+
+    def __delattr__(self, name):
+        """Raise an AttributeError, for the same reason as __setattr__.
+
+        @type self: Location
+        @type name: str
         @rtype: None
+
+        >>> del Location(1, 2).col
+        Traceback (most recent call last):
+        AttributeError: Location is immutable
         """
-        pass
-        self.row = row
-        self.col = column
+        raise AttributeError("Location is immutable")
 
     def __str__(self):
         """Return a string representation.
@@ -21,9 +95,24 @@ class Location:
     def __eq__(self, other):
         """Return True if self equals other, and false otherwise.
 
+        @type other: Location
         @rtype: bool
+
+        >>> Location(1, 2) == Location(1, 2)
+        True
+        >>> Location(1, 2) == Location(2, 1)
+        False
+        """
+        return self is other or (isinstance(other, Location) and
+                                 self.row == other.row and
+                                 self.col == other.col)
+
+    def __hash__(self):
+        """Return a hash consistent with __eq__.
+
+        @rtype: int
         """
-        return self == other
+        return hash((self.row, self.col))
 
 
 def manhattan_distance(origin, destination):
@@ -36,14 +125,47 @@ def manhattan_distance(origin, destination):
     return abs(origin.row - destination.row) + abs(origin.col - destination.col)
 
 
+def travel_time(origin_row, origin_col, destination_row, destination_col,
+                speed):
+    """Return the time it takes to drive from the origin to the destination
+    at <speed>, rounded to the nearest integer.
+
+    The locations are given as plain coordinates so that callers which
+    already hold them do not need Location objects.
+
+    @type origin_row: int
+    @type origin_col: int
+    @type destination_row: int
+    @type destination_col: int
+    @type speed: int
+    @rtype: int
+
+    >>> travel_time(1, 1, 4, 3, 2)
+    2
+    >>> travel_time(1, 1, 4, 4, 4)
+    2
+    """
+    distance = (abs(origin_row - destination_row) +
+                abs(origin_col - destination_col))
+    # Integer form of round(distance / speed), including its rounding of
+    # halves to the nearest even integer, without going through a float.
+    time = distance // speed
+    twice_remainder = 2 * (distance - time * speed)
+    if twice_remainder > speed or (twice_remainder == speed and time & 1):
+        time += 1
+    return time
+
+
 def deserialize_location(location_str):
     """Deserialize a location.
 
     @type location_str: str
         A location in the format 'row,col'
     @rtype: Location
+
+    >>> location = deserialize_location('4,2')
+    >>> location.row, location.col
+    (4, 2)
     """
-    # Parse the string and type cast it
-    temp_list = location_str.split(',')
-    result = Location(int(temp_list[1]), int(temp_list[0]))
-    return result
+    row, col = location_str.split(',')
+    return Location(int(row), int(col))
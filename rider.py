@@ -3,20 +3,48 @@ The rider module contains the Rider class. It also contains
 constants that represent the status of the rider.
 
 === Constants ===
-@type WAITING: str
+@type WAITING: RiderStatus
     A constant used for the waiting rider status.
-@type CANCELLED: str
+@type CANCELLED: RiderStatus
     A constant used for the cancelled rider status.
-@type SATISFIED: str
+@type SATISFIED: RiderStatus
     A constant used for the satisfied rider status
+@type AFTER_CANCEL: dict[RiderStatus, RiderStatus]
+    The status a rider has after cancelling, keyed by their status
+    before cancelling. Only a waiting rider becomes cancelled.
+
+>>> AFTER_CANCEL[WAITING] is CANCELLED
+True
+>>> AFTER_CANCEL[SATISFIED] is SATISFIED
+True
 """
+from enum import IntEnum
+from functools import total_ordering
 from location import Location
 
-WAITING = "waiting"
-CANCELLED = "cancelled"
-SATISFIED = "satisfied"
 
+class RiderStatus(IntEnum):
+    """The status of a rider.
+
+    Statuses are small integers, so comparing them is an integer compare
+    rather than a string compare. Each status is a single object, so
+    callers test a rider's status with "is".
+    """
+    WAITING = 0
+    CANCELLED = 1
+    SATISFIED = 2
+
+
+WAITING = RiderStatus.WAITING
+CANCELLED = RiderStatus.CANCELLED
+SATISFIED = RiderStatus.SATISFIED
+
+AFTER_CANCEL = {WAITING: CANCELLED,
+                CANCELLED: CANCELLED,
+                SATISFIED: SATISFIED}
 
+
+@total_ordering
 class Rider:
     """ A rider for a ride sharing service
 
@@ -29,8 +57,20 @@ class Rider:
         The riders requested destination
     @type patience: int
         The amount of minutes the rider will wait
+    @type status: RiderStatus
+        Whether the rider is waiting, cancelled or satisfied
+    @type timestamp: int
+        The time at which the rider requested a driver
+    @type expires_at: int
+        The time at which the rider cancels if they have not been picked up
+
+    Riders are ordered by timestamp. Only __eq__ and __lt__ are defined;
+    total_ordering derives the other comparisons from them.
     """
-    #TODO
+
+    __slots__ = ('status', 'id', 'origin', 'destination', 'patience',
+                 'timestamp', 'expires_at')
+
     def __init__(self, timestamp, identifier, patience, origin, destination):
         """Initialize a Rider.
 
@@ -47,27 +87,28 @@ class Rider:
         self.destination = destination  # The riders requested destination.
         self.patience = patience # The amount of minutes the rider will wait.
         self.timestamp = timestamp
+        self.expires_at = timestamp + patience
 
     def __eq__(self, other):
-        """Return true if self is equal to other and false otherwise.
+        """Return True iff self and other requested a driver at the same time.
 
         @param other: Rider
         @return: bool
         """
-        return self.timestamp == other.timestamp
+        return self is other or (type(other) is Rider and
+                                 self.timestamp == other.timestamp)
 
-    def __lt__(self, other):
-        """Return true if self is less than other and false otherwise.
+    def __hash__(self):
+        """Return the hash of the timestamp, consistent with __eq__.
 
-        @param other: Rider
-        @return: bool
+        @return: int
         """
-        return self.timestamp < other.timestamp
+        return hash(self.timestamp)
 
-    def __ge__(self, other):
-        """Return true if self is greater than other and false otherwise.
+    def __lt__(self, other):
+        """Return True iff self requested a driver before other.
 
         @param other: Rider
         @return: bool
         """
-        return self.timestamp > other.timestamp
\ No newline at end of file
+        return self.timestamp < other.timestamp
@@ -1,3 +1,4 @@
+from operator import attrgetter
 from container import PriorityQueue
 from dispatcher import Dispatcher
 from event import Event, create_event_list
@@ -35,7 +36,9 @@ class Simulation:
         @type self: Simulation
         @rtype: None
         """
-        self._events = PriorityQueue()
+        # Keying on the timestamp lets the queue compare plain ints instead
+        # of calling Event's comparison methods.
+        self._events = PriorityQueue(key=attrgetter('timestamp'))
         self._dispatcher = Dispatcher()
         self._monitor = Monitor()
 
@@ -50,21 +53,25 @@ class Simulation:
             An initial list of events.
         @rtype: dict[str, object]
         """
+        # Bind the queue's methods once; the loop below runs once per event.
+        add = self._events.add
+        remove = self._events.remove
+        is_empty = self._events.is_empty
+        dispatcher = self._dispatcher
+        monitor = self._monitor
         # Add all initial events to the event queue.
         for event in initial_events:
-            self._events.add(event)
+            add(event)
         # Until there are no more events, remove an event
         # from the event queue and do it. Add any returned
         # events to the event queue.
-        while not self._events.is_empty():
-            temp_event = self._events.remove()
-            temp_events = []
-            temp_events = temp_event.do(self._dispatcher,self._monitor)
+        while not is_empty():
+            temp_event = remove()
+            temp_events = temp_event.do(dispatcher, monitor)
             #print(temp_event.__str__())  #Print out the list of events.
-            if temp_events is not None:
-                for event in temp_events:
-                    self._events.add(event)
-        return self._monitor.report()
+            for event in temp_events:
+                add(event)
+        return monitor.report()
 
 
 if __name__ == "__main__":